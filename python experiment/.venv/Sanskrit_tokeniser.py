@@ -0,0 +1,133 @@
+import queue
+import re
+import threading
+import traceback
+from functools import lru_cache
+import tkinter as tk
+from tkinter import scrolledtext
+
+import nltk
+from nltk.sentiment import SentimentIntensityAnalyzer
+
+from _tokenizer_core import tokenize
+
+# --- Sentiment ---
+
+# Loading the VADER lexicon is slow, so wait until the first analysis
+@lru_cache(maxsize=1)
+def get_sia():
+    try:
+        nltk.data.find("sentiment/vader_lexicon.zip")
+    except LookupError:
+        nltk.download("vader_lexicon")
+
+    return SentimentIntensityAnalyzer()
+
+# Matches a whole line of ASCII letters; tokens never contain whitespace, so
+# with one token per line this picks out the all-English tokens in one scan
+ENGLISH_RE = re.compile(r"^[A-Za-z]+$", re.MULTILINE)
+
+def english_sentiment(tokens):
+    english_words = ENGLISH_RE.findall("\n".join(tokens))
+    if not english_words:
+        return "Neutral (no English detected)"
+
+    # An offline first run cannot download the lexicon; get_sia is retried on
+    # the next analysis since lru_cache does not cache the exception
+    try:
+        sia = get_sia()
+    except LookupError:
+        return "Sentiment unavailable (VADER lexicon not found)"
+
+    text = " ".join(english_words)
+    scores = sia.polarity_scores(text)
+
+    if scores["compound"] >= 0.05:
+        label = "Positive"
+    elif scores["compound"] <= -0.05:
+        label = "Negative"
+    else:
+        label = "Neutral"
+
+    return f"{label}\nScores: {scores}"
+
+# --- Tkinter UI ---
+
+def analyze_worker(text, strip_diac, ascii_map, results):
+    # Runs off the main thread, so it must not touch any widget. Always put a
+    # result on the queue, or show_results would poll forever.
+    try:
+        tokens = tokenize(text, strip_diac, ascii_map)
+        results.put((tokens, english_sentiment(tokens)))
+    except Exception as exc:
+        traceback.print_exc()
+        results.put(f"Analysis failed: {exc}")
+
+def show_results(results):
+    try:
+        result = results.get_nowait()
+    except queue.Empty:
+        root.after(50, show_results, results)
+        return
+
+    if isinstance(result, str):
+        tokens, sentiment = [], result
+    else:
+        tokens, sentiment = result
+
+    token_box.delete("1.0", tk.END)
+    token_box.insert(tk.END, " ".join(tokens))
+
+    sentiment_box.delete("1.0", tk.END)
+    sentiment_box.insert(tk.END, sentiment)
+
+    analyze_button.config(state=tk.NORMAL)
+
+def run_analysis():
+    text = input_box.get("1.0", tk.END).strip()
+
+    strip_diac = strip_var.get()
+    ascii_map = ascii_var.get()
+
+    # One analysis at a time, so an older result never overwrites a newer one
+    analyze_button.config(state=tk.DISABLED)
+
+    results = queue.Queue(maxsize=1)
+    threading.Thread(
+        target=analyze_worker,
+        args=(text, strip_diac, ascii_map, results),
+        daemon=True,
+    ).start()
+    root.after(50, show_results, results)
+
+
+root = tk.Tk()
+root.title("English + Sanskrit NLP Tokenizer")
+
+# Input
+tk.Label(root, text="Enter Text:").pack()
+input_box = scrolledtext.ScrolledText(root, height=5)
+input_box.pack(fill="both", padx=5, pady=5)
+
+# Options
+strip_var = tk.BooleanVar()
+ascii_var = tk.BooleanVar()
+
+tk.Checkbutton(root, text="Strip Diacritics", variable=strip_var).pack(anchor="w")
+tk.Checkbutton(root, text="Convert IAST → ASCII", variable=ascii_var).pack(anchor="w")
+
+# Run button
+analyze_button = tk.Button(root, text="Analyze", command=run_analysis)
+analyze_button.pack(pady=10)
+
+# Output tokens
+tk.Label(root, text="Tokens:").pack()
+token_box = scrolledtext.ScrolledText(root, height=3)
+token_box.pack(fill="both", padx=5, pady=5)
+
+# Output sentiment
+tk.Label(root, text="Sentiment:").pack()
+sentiment_box = scrolledtext.ScrolledText(root, height=5)
+sentiment_box.pack(fill="both", padx=5, pady=5)
+
+root.mainloop()
@@ -0,0 +1,84 @@
+"""Unicode preprocessing and tokenizer for Sanskrit_tokeniser.py.
+
+Kept free of Tk and NLTK so the mapping and regexes are built once and can be
+imported without opening the UI.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+
+# --- Unicode helpers ---
+
+def normalize_text(text: str) -> str:
+    return unicodedata.normalize("NFC", text)
+
+IAST_MAP = {
+    "ā":"a","ī":"i","ū":"u","ṛ":"r","ṝ":"r","ḷ":"l",
+    "ṅ":"n","ñ":"n","ṇ":"n","ṣ":"s","ś":"s","ḥ":"h","ṁ":"m",
+    "Ā":"A","Ī":"I","Ū":"U","Ṛ":"R","Ṝ":"R","Ḷ":"L",
+    "Ṅ":"N","Ñ":"N","Ṇ":"N","Ṣ":"S","Ś":"S","Ḥ":"H","Ṁ":"M"
+}
+
+def strip_diacritics(text: str) -> str:
+    # ASCII has no decompositions or combining marks
+    if text.isascii():
+        return text
+    nfkd = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in nfkd if not unicodedata.combining(ch))
+
+def iast_to_ascii(text: str) -> str:
+    return "".join(IAST_MAP.get(ch, ch) for ch in text)
+
+# --- Tokenizer ---
+
+WORD_RE = re.compile(r"[A-Za-z\u0100-\u024F\u1E00-\u1EFF]+(?:[-'][A-Za-z]+)*")
+NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+PUNCT_RE = re.compile(r"[^\s\w]")
+
+# Same precedence as trying NUMBER_RE, WORD_RE, PUNCT_RE in turn, with any
+# other non-space character as a single-char token. No capturing groups, so
+# findall returns the matched tokens and builds the list in C.
+def _fused_token_pattern(number, word, punct):
+    return f"{number}|{word}|{punct}|\\S"
+
+# Possessive runs match the same tokens (nothing after a run can take its
+# characters back) but spare the engine the backtrack bookkeeping.
+# They need Python 3.11+; older versions use the plain patterns.
+try:
+    TOKEN_RE = re.compile(_fused_token_pattern(
+        r"\d++(?:[.,]\d++)*+",
+        r"[A-Za-z\u0100-\u024F\u1E00-\u1EFF]++(?:[-'][A-Za-z]++)*+",
+        PUNCT_RE.pattern,
+    ))
+except re.error:
+    TOKEN_RE = re.compile(_fused_token_pattern(
+        NUMBER_RE.pattern, WORD_RE.pattern, PUNCT_RE.pattern
+    ))
+
+def _make_preprocessor(strip_diac, ascii_map):
+    if strip_diac:
+        # NFKD subsumes NFC and decomposes every IAST letter before the marks
+        # are dropped, so normalize_text and iast_to_ascii would be no-ops
+        return strip_diacritics
+
+    if ascii_map:
+        def normalize_and_map(text):
+            return iast_to_ascii(normalize_text(text))
+        return normalize_and_map
+
+    return normalize_text
+
+# Small cache so pressing Analyze again on the same input is free; tuples keep
+# callers from mutating a cached result
+@lru_cache(maxsize=8)
+def _cached_tokens(text, strip_diac, ascii_map):
+    prep = _make_preprocessor(strip_diac, ascii_map)
+    return tuple(TOKEN_RE.findall(prep(text)))
+
+def tokenize(text, strip_diac=False, ascii_map=False):
+    return list(_cached_tokens(text, bool(strip_diac), bool(ascii_map)))
+
+def tokenize_many(texts, strip_diac=False, ascii_map=False):
+    prep = _make_preprocessor(strip_diac, ascii_map)
+    findall = TOKEN_RE.findall
+    return [findall(prep(text)) for text in texts]